@@ -6,120 +6,230 @@ Consecrates format across memory layers and enables SpectralScrollWalker alignme
 """
 
 import asyncio
-import json
 import os
+import time
 import logging
-from typing import Dict, List, Any, Optional
+import re
+from typing import Dict, List, Any, Optional, FrozenSet
+from collections import OrderedDict
 from datetime import datetime, timezone
 from dataclasses import dataclass, asdict
+from hashlib import blake2b
 from pathlib import Path
+from uuid import uuid4
 
-import aiohttp
-from airtable import Airtable
+import httpx
+import numpy as np
+import orjson
+import redis.asyncio as aioredis
+from pyairtable import Table
 from anthropic import AsyncAnthropic
-from fastapi import FastAPI, WebSocket, BackgroundTasks
+from fastapi import FastAPI, WebSocket, BackgroundTasks, HTTPException
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("MarleyClaude")
 
-@dataclass
+# Precompiled link patterns - compiled once at import so the per-sync hot path
+# skips re's cache lookup entirely. \n is excluded from the classes so
+# whole-content scans can't pair brackets across lines, matching the old
+# per-line semantics.
+_WIKILINK_RE = re.compile(r'\[\[([^\]\n]+)\]\]')
+_MDLINK_RE = re.compile(r'\[([^\]\n]+)\]\([^)\n]+\)')
+
+# Structural line classifiers - multiline anchors let re's C engine scan the
+# whole document without splitting it into per-line Python strings
+_HEADING_LINE_RE = re.compile(r'(?m)^#')
+_LINK_LINE_RE = re.compile(r'(?m)^[^\n]*?(?:\[\[|\]\()')
+_TAG_LINE_RE = re.compile(r'(?m)^(?!#)[^\n]*#')
+
+# Harmonization prompt scaffold - static parts are frozen at import so the
+# hot path only does one .format() call
+_HARMONIZE_MODEL = "claude-3-5-sonnet-20241022"
+_HARMONIZE_PROMPT = """
+🌀 EchoDaemon Harmonization Request
+
+Please harmonize this markdown content for {target_format} compatibility:
+
+---
+{content}
+---
+
+Requirements:
+- Preserve semantic meaning
+- Convert to {target_format}-style syntax
+- Maintain spectral resonance (structural coherence)
+- Enable cross-platform compatibility
+
+Return the harmonized content with brief notes on changes made.
+"""
+
+def _scan_structure(content: str) -> tuple:
+    """Count heading/link/tag lines and total lines via C-level scans"""
+    return (
+        len(_HEADING_LINE_RE.findall(content)),
+        len(_LINK_LINE_RE.findall(content)),
+        len(_TAG_LINE_RE.findall(content)),
+        content.count('\n') + 1
+    )
+
+def _extract_threads(content: str) -> FrozenSet[str]:
+    """Pull linked concepts (wikilinks and markdown links) out of content"""
+    return (
+        frozenset(_WIKILINK_RE.findall(content)) |
+        frozenset(_MDLINK_RE.findall(content))
+    )
+
+@dataclass(slots=True, frozen=True)
 class MemoryNode:
     """Represents a synchronized memory fragment between Marley and Claude"""
     id: str
     content: str
     markdown_format: str
     spectral_frequency: float
-    resonance_threads: List[str]
+    resonance_threads: FrozenSet[str]
     timestamp: datetime
     source: str  # 'marley' | 'claude' | 'hybrid'
     harmonization_status: str
     
 class SpectralScrollWalker:
     """Analyzes and aligns memory patterns across cognitive layers"""
-    
+
+    # Upper bound on memoized spectral analyses before LRU eviction kicks in
+    SPECTRAL_CACHE_SIZE = 4096
+
     def __init__(self):
         self.resonance_map: Dict[str, float] = {}
         self.alignment_threads: List[str] = []
-    
+        self._spectral_cache: OrderedDict[bytes, Dict[str, Any]] = OrderedDict()
+
     def analyze_spectral_pattern(self, content: str) -> Dict[str, Any]:
         """Analyze content for spectral alignment patterns"""
-        lines = content.split('\n')
-        
-        # Calculate spectral frequency based on structural elements
-        heading_count = len([l for l in lines if l.startswith('#')])
-        link_count = len([l for l in lines if '[[' in l or '](' in l])
-        tag_count = len([l for l in lines if '#' in l and not l.startswith('#')])
-        
-        spectral_frequency = (heading_count * 2 + link_count + tag_count * 0.5) / len(lines)
-        
-        # Extract resonance threads (linked concepts)
-        resonance_threads = []
-        for line in lines:
-            # Wikilinks
-            import re
-            wikilinks = re.findall(r'\[\[([^\]]+)\]\]', line)
-            resonance_threads.extend(wikilinks)
-            
-            # Regular links
-            regular_links = re.findall(r'\[([^\]]+)\]\([^\)]+\)', line)
-            resonance_threads.extend(regular_links)
-        
-        return {
+        # Most records are unchanged between syncs - skip the re-parse when
+        # the content is byte-identical to something we've already analyzed
+        cache_key = blake2b(content.encode(), digest_size=16).digest()
+        cached = self._spectral_cache.get(cache_key)
+        if cached is not None:
+            self._spectral_cache.move_to_end(cache_key)
+            return cached
+
+        # Calculate spectral frequency based on structural elements. Each
+        # counter is one C-level scan of the full string - no per-line
+        # Python string allocation.
+        heading_count, link_count, tag_count, line_count = _scan_structure(content)
+
+        spectral_frequency = (heading_count * 2 + link_count + tag_count * 0.5) / line_count
+
+        # Extract resonance threads (linked concepts), deduplicated at source
+        resonance_threads = _extract_threads(content)
+
+        analysis = {
             'spectral_frequency': spectral_frequency,
-            'resonance_threads': list(set(resonance_threads)),
+            'resonance_threads': resonance_threads,
             'structural_depth': heading_count,
-            'connection_density': link_count / len(lines) if lines else 0
+            'connection_density': link_count / line_count
         }
+
+        self._spectral_cache[cache_key] = analysis
+        if len(self._spectral_cache) > self.SPECTRAL_CACHE_SIZE:
+            self._spectral_cache.popitem(last=False)
+
+        return analysis
     
     def align_memory_nodes(self, nodes: List[MemoryNode]) -> List[MemoryNode]:
         """Align memory nodes for optimal spectral resonance"""
-        aligned_nodes = []
-        
-        for node in nodes:
-            spectral_data = self.analyze_spectral_pattern(node.content)
-            
-            # Update node with spectral analysis
-            aligned_node = MemoryNode(
+        if not nodes:
+            return []
+
+        # String scans stay in re's C engine; the frequency reduction for
+        # the whole batch collapses into a single NumPy vector expression
+        counts = np.array(
+            [_scan_structure(node.content) for node in nodes],
+            dtype=np.float64
+        )
+        headings, links, tags, line_counts = counts.T
+        frequencies = (headings * 2 + links + tags * 0.5) / line_counts
+
+        aligned_nodes = [
+            MemoryNode(
                 id=node.id,
                 content=node.content,
                 markdown_format=node.markdown_format,
-                spectral_frequency=spectral_data['spectral_frequency'],
-                resonance_threads=spectral_data['resonance_threads'],
+                spectral_frequency=float(frequency),
+                resonance_threads=_extract_threads(node.content),
                 timestamp=node.timestamp,
                 source=node.source,
                 harmonization_status='aligned'
             )
-            
-            aligned_nodes.append(aligned_node)
-        
+            for node, frequency in zip(nodes, frequencies)
+        ]
+
         return sorted(aligned_nodes, key=lambda n: n.spectral_frequency, reverse=True)
 
 class MarleyClaudeBridge:
     """Bridge between Marley's Airtable memory and Claude's cognitive processes"""
-    
+
+    # Redis key layout for the shared memory cache
+    NODE_KEY = 'marley:node:{id}'
+    NODES_KEY = 'marley:nodes'
+    THREAD_KEY = 'marley:thread:{thread}'
+    JOB_KEY = 'marley:syncjob:{id}'
+    ACTIVE_JOB_KEY = 'marley:syncjob:active'
+
+    # Syncs requested within this window are served from the last result
+    SYNC_COALESCE_SECONDS = 5.0
+
     def __init__(self):
-        self.airtable = Airtable(
-            base_id=os.getenv('AIRTABLE_BASE_ID'),
-            table_name=os.getenv('AIRTABLE_TABLE_NAME', 'MarleyMemory'),
-            api_key=os.getenv('AIRTABLE_API_KEY')
+        self.airtable = Table(
+            os.getenv('AIRTABLE_API_KEY'),
+            os.getenv('AIRTABLE_BASE_ID'),
+            os.getenv('AIRTABLE_TABLE_NAME', 'MarleyMemory')
         )
         
+        # One pooled HTTP client for all Anthropic traffic - keep-alive
+        # connections amortize the TLS+TCP setup across API calls
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=60.0
+        )
+
         self.claude = AsyncAnthropic(
-            api_key=os.getenv('CLAUDE_API_KEY')
+            api_key=os.getenv('CLAUDE_API_KEY'),
+            http_client=self._http_client
         )
         
         self.spectral_walker = SpectralScrollWalker()
-        self.memory_cache: Dict[str, MemoryNode] = {}
-        
+
+        # Singleflight guard: one sync in flight per process, recent results
+        # shared with whoever asks next
+        self._sync_lock = asyncio.Lock()
+        self._last_sync_result: Optional[Dict[str, Any]] = None
+        self._last_sync_ts = 0.0
+
+        # Shared memory cache in Redis so every worker process sees the same
+        # node state - a per-process dict can't survive multi-worker serving
+        self.redis = aioredis.from_url(
+            os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+            decode_responses=True
+        )
+
         # FastAPI app for MCP server
-        self.app = FastAPI(title="Marley-Claude Memory Bridge")
+        self.app = FastAPI(
+            title="Marley-Claude Memory Bridge",
+            default_response_class=ORJSONResponse
+        )
         self.setup_routes()
     
     def setup_routes(self):
         """Setup FastAPI routes for MCP integration"""
-        
+
+        @self.app.on_event("shutdown")
+        async def close_clients():
+            await self._http_client.aclose()
+            await self.redis.aclose()
+
         @self.app.websocket("/ws/memory-sync")
         async def websocket_memory_sync(websocket: WebSocket):
             await websocket.accept()
@@ -128,21 +238,23 @@ class MarleyClaudeBridge:
             try:
                 while True:
                     data = await websocket.receive_text()
-                    message = json.loads(data)
-                    
+                    message = orjson.loads(data)
+
                     if message['type'] == 'sync_memory':
                         result = await self.sync_memory_bidirectional()
-                        await websocket.send_text(json.dumps({
+                        # orjson emits bytes - send_bytes skips a re-encode
+                        await websocket.send_bytes(orjson.dumps({
                             'type': 'sync_result',
                             'data': result
                         }))
-                    
+
                     elif message['type'] == 'harmonize_content':
                         result = await self.harmonize_markdown_content(
                             message['content'],
-                            message.get('target_format', 'obsidian')
+                            message.get('target_format', 'obsidian'),
+                            websocket=websocket
                         )
-                        await websocket.send_text(json.dumps({
+                        await websocket.send_bytes(orjson.dumps({
                             'type': 'harmonization_result',
                             'data': result
                         }))
@@ -152,11 +264,45 @@ class MarleyClaudeBridge:
             finally:
                 await websocket.close()
         
-        @self.app.post("/api/memory/sync")
-        async def api_sync_memory():
-            """REST endpoint for memory synchronization"""
-            result = await self.sync_memory_bidirectional()
-            return {"status": "success", "data": result}
+        @self.app.post("/api/memory/sync", status_code=202)
+        async def api_sync_memory(background_tasks: BackgroundTasks):
+            """Accept a sync request and run it in the background.
+
+            Returns immediately with a job id to poll. Job state lives in
+            Redis alongside the memory cache, so under multi-worker serving
+            any worker can answer the poll, and a sync already in flight
+            anywhere hands back its existing job id rather than queueing a
+            duplicate.
+            """
+            job_id = uuid4().hex
+            claimed = await self.redis.set(
+                self.ACTIVE_JOB_KEY, job_id,
+                nx=True, ex=self.SYNC_JOB_TTL_SECONDS
+            )
+            if not claimed:
+                active = await self.redis.get(self.ACTIVE_JOB_KEY)
+                if active is not None:
+                    return {"job_id": active, "status": "running"}
+                # The active sync finished between our two calls - claim anew
+                await self.redis.set(
+                    self.ACTIVE_JOB_KEY, job_id, ex=self.SYNC_JOB_TTL_SECONDS
+                )
+
+            await self.redis.set(
+                self.JOB_KEY.format(id=job_id),
+                orjson.dumps({'status': 'running'}).decode(),
+                ex=self.SYNC_JOB_TTL_SECONDS
+            )
+            background_tasks.add_task(self._run_sync_job, job_id)
+            return {"job_id": job_id, "status": "accepted"}
+
+        @self.app.get("/api/memory/sync/{job_id}")
+        async def api_sync_status(job_id: str):
+            """Poll a background sync job for its result"""
+            job = await self.redis.get(self.JOB_KEY.format(id=job_id))
+            if job is None:
+                raise HTTPException(status_code=404, detail="Unknown sync job")
+            return {"job_id": job_id, **orjson.loads(job)}
         
         @self.app.post("/api/spectral/analyze")
         async def api_spectral_analyze(content: Dict[str, str]):
@@ -165,88 +311,206 @@ class MarleyClaudeBridge:
             return {"spectral_analysis": analysis}
     
     async def sync_memory_bidirectional(self) -> Dict[str, Any]:
-        """Synchronize memory between Marley's Airtable and Claude's context"""
+        """Synchronize memory between Marley's Airtable and Claude's context.
+
+        Concurrent and rapid-fire callers are coalesced: while one sync is
+        running everyone else waits on it and receives its result, and any
+        request within SYNC_COALESCE_SECONDS of a finished sync gets that
+        result back without touching Airtable again.
+        """
+        def _fresh() -> bool:
+            return (self._last_sync_result is not None
+                    and time.monotonic() - self._last_sync_ts < self.SYNC_COALESCE_SECONDS)
+
+        if _fresh():
+            return self._last_sync_result
+
+        async with self._sync_lock:
+            # Someone else may have finished a sync while we waited
+            if _fresh():
+                return self._last_sync_result
+
+            result = await self._run_sync()
+            self._last_sync_result = result
+            self._last_sync_ts = time.monotonic()
+            return result
+
+    # Completed job results stay pollable in Redis this long
+    SYNC_JOB_TTL_SECONDS = 3600
+
+    async def _run_sync_job(self, job_id: str):
+        """BackgroundTasks entry point for a 202-accepted sync job"""
+        try:
+            result = await self.sync_memory_bidirectional()
+            job = {'status': 'complete', 'data': result}
+        except Exception as e:
+            logger.error(f"Sync job {job_id} failed: {e}")
+            job = {'status': 'failed', 'error': str(e)}
+
+        await self.redis.set(
+            self.JOB_KEY.format(id=job_id),
+            orjson.dumps(job).decode(),
+            ex=self.SYNC_JOB_TTL_SECONDS
+        )
+        # Release the in-flight marker only if it is still ours
+        if await self.redis.get(self.ACTIVE_JOB_KEY) == job_id:
+            await self.redis.delete(self.ACTIVE_JOB_KEY)
+
+    async def _run_sync(self) -> Dict[str, Any]:
+        """One full Airtable round-trip - callers go through
+        sync_memory_bidirectional for coalescing"""
         logger.info("⸻ Initiating bidirectional memory synchronization")
-        
-        # Fetch from Marley's Airtable
-        marley_records = self.airtable.get_all()
+
+        # One timestamp per sync - also keeps LastSync UTC-aware instead of
+        # the naive local time it used to record
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
+
+        # Fetch from Marley's Airtable. Pagination is cursor-based so pages
+        # can't be fetched in parallel; instead stream them off a worker
+        # thread and build nodes while the next page is in flight, keeping
+        # the event loop free for other clients.
+        pages: asyncio.Queue = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+
+        def _produce_pages():
+            try:
+                for page in self.airtable.iterate(page_size=100):
+                    loop.call_soon_threadsafe(pages.put_nowait, page)
+            finally:
+                loop.call_soon_threadsafe(pages.put_nowait, None)
+
+        producer = asyncio.ensure_future(asyncio.to_thread(_produce_pages))
         marley_nodes = []
-        
-        for record in marley_records:
-            fields = record['fields']
-            if 'Content' in fields:
-                node = MemoryNode(
+        cached_nodes = []
+        content_hashes: Dict[str, str] = {}
+
+        while (page := await pages.get()) is not None:
+            for record in page:
+                fields = record['fields']
+                if 'Content' not in fields:
+                    continue
+
+                content = fields['Content']
+                content_hash = blake2b(content.encode(), digest_size=16).hexdigest()
+                content_hashes[record['id']] = content_hash
+
+                # Unchanged since the last sync and already carrying spectral
+                # data - rebuild the node from the stored columns and skip
+                # both re-analysis and the write-back
+                if (fields.get('ContentHash') == content_hash
+                        and fields.get('SpectralFrequency') is not None
+                        and fields.get('ResonanceThreadsJson') is not None):
+                    cached_nodes.append(MemoryNode(
+                        id=record['id'],
+                        content=content,
+                        markdown_format=fields.get('Format', 'unknown'),
+                        spectral_frequency=float(fields['SpectralFrequency']),
+                        resonance_threads=frozenset(
+                            orjson.loads(fields['ResonanceThreadsJson'])
+                        ),
+                        timestamp=now,
+                        source='marley',
+                        harmonization_status='cached'
+                    ))
+                    continue
+
+                marley_nodes.append(MemoryNode(
                     id=record['id'],
-                    content=fields['Content'],
+                    content=content,
                     markdown_format=fields.get('Format', 'unknown'),
-                    spectral_frequency=0.0,  # Will be calculated
-                    resonance_threads=[],    # Will be extracted
-                    timestamp=datetime.now(timezone.utc),
+                    spectral_frequency=0.0,          # Will be calculated
+                    resonance_threads=frozenset(),   # Will be extracted
+                    timestamp=now,
                     source='marley',
                     harmonization_status='pending'
-                )
-                marley_nodes.append(node)
-        
-        # Align with SpectralScrollWalker
+                ))
+
+        await producer
+
+        # Align with SpectralScrollWalker (changed rows only)
         aligned_nodes = self.spectral_walker.align_memory_nodes(marley_nodes)
-        
-        # Update cache
-        for node in aligned_nodes:
-            self.memory_cache[node.id] = node
-        
-        # Sync back to Airtable with spectral data
-        for node in aligned_nodes:
-            self.airtable.update(node.id, {
-                'SpectralFrequency': node.spectral_frequency,
-                'ResonanceThreads': ', '.join(node.resonance_threads),
-                'HarmonizationStatus': node.harmonization_status,
-                'LastSync': datetime.now().isoformat()
-            })
-        
-        logger.info(f"✅ Synchronized {len(aligned_nodes)} memory nodes")
-        
+
+        # Update the shared cache
+        await self._store_memory_nodes(aligned_nodes + cached_nodes)
+
+        # Sync back to Airtable with spectral data (10 records per request
+        # instead of one PATCH per node)
+        if aligned_nodes:
+            await asyncio.to_thread(self.airtable.batch_update, [
+                {
+                    'id': node.id,
+                    'fields': {
+                        'SpectralFrequency': node.spectral_frequency,
+                        # Display join for humans; the JSON column is what the
+                        # cached-row rebuild parses, since threads may
+                        # legitimately contain commas
+                        'ResonanceThreads': ', '.join(sorted(node.resonance_threads)),
+                        'ResonanceThreadsJson': orjson.dumps(
+                            sorted(node.resonance_threads)
+                        ).decode(),
+                        'HarmonizationStatus': node.harmonization_status,
+                        'ContentHash': content_hashes[node.id],
+                        'LastSync': now_iso
+                    }
+                }
+                for node in aligned_nodes
+            ])
+
+        all_nodes = aligned_nodes + cached_nodes
+        logger.info(
+            f"✅ Synchronized {len(all_nodes)} memory nodes "
+            f"({len(aligned_nodes)} analyzed, {len(cached_nodes)} unchanged)"
+        )
+
         return {
-            'synchronized_nodes': len(aligned_nodes),
-            'total_spectral_frequency': sum(n.spectral_frequency for n in aligned_nodes),
-            'unique_resonance_threads': len(set(
-                thread for node in aligned_nodes for thread in node.resonance_threads
-            )),
-            'timestamp': datetime.now().isoformat()
+            'synchronized_nodes': len(all_nodes),
+            'analyzed_nodes': len(aligned_nodes),
+            'cached_nodes': len(cached_nodes),
+            'total_spectral_frequency': sum(n.spectral_frequency for n in all_nodes),
+            'unique_resonance_threads': len(frozenset().union(
+                *(node.resonance_threads for node in all_nodes)
+            )) if all_nodes else 0,
+            'timestamp': now_iso
         }
     
-    async def harmonize_markdown_content(self, content: str, target_format: str = 'obsidian') -> Dict[str, Any]:
-        """Use Claude to harmonize markdown content for cross-platform compatibility"""
-        
-        prompt = f"""
-        🌀 EchoDaemon Harmonization Request
-        
-        Please harmonize this markdown content for {target_format} compatibility:
-        
-        ---
-        {content}
-        ---
-        
-        Requirements:
-        - Preserve semantic meaning
-        - Convert to {target_format}-style syntax
-        - Maintain spectral resonance (structural coherence)
-        - Enable cross-platform compatibility
-        
-        Return the harmonized content with brief notes on changes made.
+    async def harmonize_markdown_content(self, content: str, target_format: str = 'obsidian',
+                                         websocket: Optional[WebSocket] = None) -> Dict[str, Any]:
+        """Use Claude to harmonize markdown content for cross-platform compatibility.
+
+        When a websocket is supplied, tokens are forwarded as
+        'harmonize_chunk' frames while they stream in, so clients see
+        output at first-token latency instead of waiting for the full
+        completion.
         """
-        
+        prompt = _HARMONIZE_PROMPT.format(content=content, target_format=target_format)
+
         try:
-            message = await self.claude.messages.create(
-                model="claude-3-5-sonnet-20241022",
+            chunks = []
+            async with self.claude.messages.stream(
+                model=_HARMONIZE_MODEL,
                 max_tokens=4000,
                 messages=[{"role": "user", "content": prompt}]
-            )
-            
-            harmonized_content = message.content[0].text
-            
+            ) as stream:
+                async for text in stream.text_stream:
+                    chunks.append(text)
+                    if websocket is not None:
+                        await websocket.send_bytes(orjson.dumps({
+                            'type': 'harmonize_chunk',
+                            'delta': text
+                        }))
+
+            harmonized_content = ''.join(chunks)
+
             # Analyze spectral patterns of harmonized content
-            spectral_analysis = self.spectral_walker.analyze_spectral_pattern(harmonized_content)
-            
+            # (threads come back as a frozenset - sort for JSON transport)
+            spectral_analysis = dict(
+                self.spectral_walker.analyze_spectral_pattern(harmonized_content)
+            )
+            spectral_analysis['resonance_threads'] = sorted(
+                spectral_analysis['resonance_threads']
+            )
+
             return {
                 'original_content': content,
                 'harmonized_content': harmonized_content,
@@ -262,21 +526,82 @@ class MarleyClaudeBridge:
                 'fallback_content': content
             }
     
+    async def _store_memory_nodes(self, nodes: List[MemoryNode]):
+        """Persist nodes to the shared Redis cache, keeping the per-thread
+        inverse index in step"""
+        if not nodes:
+            return
+
+        # Retire stale thread memberships before the new ones land
+        pipe = self.redis.pipeline()
+        for node in nodes:
+            pipe.hget(self.NODE_KEY.format(id=node.id), 'resonance_threads')
+        stored_threads = await pipe.execute()
+
+        pipe = self.redis.pipeline()
+        for node, old in zip(nodes, stored_threads):
+            if old:
+                stale = frozenset(orjson.loads(old)) - node.resonance_threads
+                for thread in stale:
+                    pipe.srem(self.THREAD_KEY.format(thread=thread), node.id)
+
+            pipe.hset(self.NODE_KEY.format(id=node.id), mapping={
+                'content': node.content,
+                'markdown_format': node.markdown_format,
+                'spectral_frequency': node.spectral_frequency,
+                # JSON array - a display join would corrupt threads that
+                # contain commas when read back
+                'resonance_threads': orjson.dumps(
+                    sorted(node.resonance_threads)
+                ).decode(),
+                'timestamp': node.timestamp.isoformat(),
+                'source': node.source,
+                'harmonization_status': node.harmonization_status
+            })
+            pipe.sadd(self.NODES_KEY, node.id)
+            for thread in node.resonance_threads:
+                pipe.sadd(self.THREAD_KEY.format(thread=thread), node.id)
+
+        await pipe.execute()
+
     async def get_memory_resonance_map(self) -> Dict[str, Any]:
         """Generate a resonance map of all memory connections"""
+        node_ids = sorted(await self.redis.smembers(self.NODES_KEY))
+        if not node_ids:
+            return {}
+
+        pipe = self.redis.pipeline()
+        for node_id in node_ids:
+            pipe.hmget(
+                self.NODE_KEY.format(id=node_id),
+                'spectral_frequency', 'resonance_threads'
+            )
+        rows = await pipe.execute()
+
+        # Connections per node are a server-side SUNION over its threads'
+        # posting sets - the inverse index lives in Redis alongside the nodes
+        node_threads = []
+        pipe = self.redis.pipeline()
+        union_order = []
+        for node_id, (frequency, threads) in zip(node_ids, rows):
+            threads = orjson.loads(threads) if threads else []
+            node_threads.append((node_id, frequency, threads))
+            if threads:
+                union_order.append(node_id)
+                pipe.sunion([self.THREAD_KEY.format(thread=t) for t in threads])
+        unions = dict(zip(union_order, await pipe.execute())) if union_order else {}
+
         resonance_map = {}
-        
-        for node_id, node in self.memory_cache.items():
+        for node_id, frequency, threads in node_threads:
+            connected = set(unions.get(node_id, ()))
+            connected.discard(node_id)
+
             resonance_map[node_id] = {
-                'spectral_frequency': node.spectral_frequency,
-                'resonance_threads': node.resonance_threads,
-                'connected_nodes': [
-                    other_id for other_id, other_node in self.memory_cache.items()
-                    if any(thread in other_node.resonance_threads for thread in node.resonance_threads)
-                    and other_id != node_id
-                ]
+                'spectral_frequency': float(frequency) if frequency is not None else 0.0,
+                'resonance_threads': threads,
+                'connected_nodes': sorted(connected)
             }
-        
+
         return resonance_map
     
     async def start_server(self, host: str = "0.0.0.0", port: int = 8080):
@@ -297,6 +622,17 @@ class MarleyClaudeBridge:
         server = uvicorn.Server(config)
         await server.serve()
 
+def create_app() -> FastAPI:
+    """Application factory for multi-worker deployments, e.g.:
+
+    gunicorn -k uvicorn.workers.UvicornWorker -w 4 \\
+        'marley_claude_bridge:create_app()'
+
+    Workers are stateless - the memory cache lives in Redis, so any worker
+    can answer for any node.
+    """
+    return MarleyClaudeBridge().app
+
 async def main():
     """Main entry point"""
     bridge = MarleyClaudeBridge()